@@ -8,21 +8,31 @@ test case validation and custom date ranges.
 Expected Test Case Results (2022-01-10 to 2025-09-22):
 - Optimum DCA: 462.1% return, $263,077.09 value, 2.26483845 BTC
 - Simple DCA: 209.4% return, $150,048.67 value, 1.29177345 BTC
+
+Usage:
+    python examples/quick_start.py                  # Full walkthrough
+    python examples/quick_start.py --mode basic     # Test case validation only
+    python examples/quick_start.py --mode flexible  # Test case + custom date ranges
 """
 
+import argparse
+import math
 import sys
-import os
-from datetime import date
-
-# Add src directory to path so we can import the analyzer
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from concurrent.futures import ThreadPoolExecutor
 
-try:
-    from optimum_dca_analyzer import FlexibleOptimumDCA, create_dca_analyzer
-except ImportError:
-    print(" Error: Could not import optimum_dca_analyzer")
-    print("Make sure you're running this from the project root directory")
-    sys.exit(1)
+def _analyzer_class():
+    """
+    Import FlexibleOptimumDCA on first use.
+    
+    Deferring the import keeps pandas/numpy out of --help and usage printing.
+    """
+    try:
+        from optimum_dca_analyzer import FlexibleOptimumDCA
+    except ImportError:
+        print(" Error: Could not import optimum_dca_analyzer")
+        print("Install the project first: pip install -e .")
+        sys.exit(1)
+    return FlexibleOptimumDCA
 
 def run_test_case():
     """Run the test case validation."""
@@ -32,29 +42,47 @@ def run_test_case():
     print("Running with test case parameters (should give 462.1% return)")
     
     # Create analyzer with test case defaults (non-verbose)
-    analyzer = FlexibleOptimumDCA(verbose=False)
+    analyzer = _analyzer_class()(verbose=False)
     
     # Run both strategies
     optimum_results = analyzer.run_optimum_dca_simulation()
     simple_results = analyzer.run_simple_dca_simulation()
     
+    optimum_pct = optimum_results['profit_pct']
+    
     # Display results
     print(f"\n RESULTS:")
     print(f"Period: {analyzer.start_date} to {analyzer.end_date} | Budget: ${analyzer.weekly_budget:.0f}/week")
     
-    print(f"\n OPTIMUM DCA:  {optimum_results['profit_pct']:>6.1f}% return | ${optimum_results['holding_value']:>11,.0f} value | {optimum_results['total_btc']:.8f} BTC")
+    print(f"\n OPTIMUM DCA:  {optimum_pct:>6.1f}% return | ${optimum_results['holding_value']:>11,.0f} value | {optimum_results['total_btc']:.8f} BTC")
     print(f" SIMPLE DCA:   {simple_results['profit_pct']:>6.1f}% return | ${simple_results['holding_value']:>11,.0f} value | {simple_results['total_btc']:.8f} BTC")
     
     # Validation
     expected_return = 462.1
-    return_match = abs(optimum_results['profit_pct'] - expected_return) < 0.1
+    return_match = math.isclose(optimum_pct, expected_return, rel_tol=0, abs_tol=0.1)
     
-    print(f"\n VALIDATION: Expected {expected_return:.1f}% | Actual {optimum_results['profit_pct']:.1f}% | {' PASSED' if return_match else ' FAILED'}")
+    print(f"\n VALIDATION: Expected {expected_return:.1f}% | Actual {optimum_pct:.1f}% | {' PASSED' if return_match else ' FAILED'}")
     
     return return_match
 
+def _run_example(example, shared_data):
+    """Run one custom-range example; returns (analyzer, optimum %, simple %)."""
+    
+    analyzer = _analyzer_class()(
+        weekly_budget=example['budget'],
+        start_date=example['start'],
+        end_date=example['end'],
+        verbose=False,
+        data=shared_data
+    )
+    
+    optimum_pct = analyzer.run_optimum_dca_simulation()['profit_pct']
+    simple_pct = analyzer.run_simple_dca_simulation()['profit_pct']
+    return analyzer, optimum_pct, simple_pct
+
 def run_custom_examples():
     """Run examples with custom date ranges."""
+    from datetime import date
     
     print("\n CUSTOM DATE RANGE EXAMPLES")
     print("=" * 50)
@@ -80,22 +108,19 @@ def run_custom_examples():
         }
     ]
     
-    for example in examples:
-        analyzer = FlexibleOptimumDCA(
-            weekly_budget=example['budget'],
-            start_date=example['start'],
-            end_date=example['end'],
-            verbose=False
-        )
-        
-        optimum = analyzer.run_optimum_dca_simulation()
-        simple = analyzer.run_simple_dca_simulation()
-        
-        outperformance = optimum['profit_pct'] - simple['profit_pct']
+    # Load the price history once and share it across all examples
+    shared_data = _analyzer_class().preload()
+    
+    # Examples are independent, so run them concurrently and print in order afterwards
+    with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+        results = list(executor.map(lambda ex: _run_example(ex, shared_data), examples))
+    
+    for example, (analyzer, optimum_pct, simple_pct) in zip(examples, results):
+        outperformance = optimum_pct - simple_pct
         
         print(f"\n{example['name']}")
         print(f"Period: {analyzer.start_date} to {analyzer.end_date} | Budget: ${analyzer.weekly_budget:.0f}/week")
-        print(f"Optimum: {optimum['profit_pct']:+6.1f}% | Simple: {simple['profit_pct']:+6.1f}% | Outperformance: {outperformance:+5.1f}pp")
+        print(f"Optimum: {optimum_pct:+6.1f}% | Simple: {simple_pct:+6.1f}% | Outperformance: {outperformance:+5.1f}pp")
 
 def show_usage_examples():
     """Show code examples for using the analyzer."""
@@ -129,8 +154,16 @@ optimum = analyzer.run_optimum_dca_simulation()
 simple = analyzer.run_simple_dca_simulation()
 """)
 
-def main():
-    """Run complete quick start demonstration."""
+MODES = ('basic', 'flexible', 'full')
+
+def main(mode: str = 'full'):
+    """
+    Run the quick start demonstration.
+    
+    Args:
+        mode: 'basic' (test case only), 'flexible' (adds custom date ranges)
+              or 'full' (adds usage examples and summary)
+    """
     
     print(" CRYPTOINVESTOR - FLEXIBLE DCA QUICK START")
     print("=" * 80)
@@ -142,9 +175,15 @@ def main():
         print("\n Test case failed! Check implementation.")
         return
     
+    if mode == 'basic':
+        return
+    
     # 2. Custom examples
     run_custom_examples()
     
+    if mode == 'flexible':
+        return
+    
     # 3. Usage examples
     show_usage_examples()
     
@@ -171,4 +210,8 @@ def main():
     print("\n Ready to analyze your custom DCA strategies!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="CryptoInvestor quick start")
+    parser.add_argument("--mode", choices=MODES, default='full',
+                        help="Which parts of the walkthrough to run (default: full)")
+    args = parser.parse_args()
+    main(mode=args.mode)
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Compiled J/K band-classification kernel for the legacy reference script.
+
+Kept in its own file so it is always imported under one top-level name,
+``_legacy_dca_kernels``: Numba's on-disk cache records the importing module's
+name, and the reference script itself is imported both as
+reference.legacy_optimum_dca and as legacy_optimum_dca. Without numba the
+kernel runs as plain Python over NumPy arrays.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel then runs as plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, nogil=True)
+def _compute_j_k(B, absD, F, M, N, O, P, Q, R, const):
+    """
+    Fused single pass producing the sheet's J ("Multiple calculation") and
+    K ("Buy/Sell Multiplier") columns; see legacy_optimum_dca.compute_weekly_table_with_scalars
+    for the formulas.
+
+    Takes the loop invariants pre-folded: ``absD`` is ABS(D) and ``const`` is (1+$X$2).
+
+    fastmath is deliberately off: blanks are NaN and the branch order relies on
+    NaN comparisons being False.
+    """
+    n = B.shape[0]
+    J = np.full(n, np.nan)
+    K = np.full(n, np.nan)
+    for i in range(n):
+        b = B[i]
+        if np.isnan(b):
+            continue
+        absd = absD[i]
+        f = F[i]
+        j = np.nan
+        if b < M[i]:
+            j = 1 + (2 * absd) + const + f
+        elif b < O[i]:
+            j = 1 + (3 * absd) + const + f
+        elif b < Q[i]:
+            j = 1 + (4 * absd) + const + f
+        elif b > N[i] and b < P[i]:
+            j = 1 - (2 * absd) - const - f
+        elif b > N[i] and b > P[i]:
+            j = 1 - (3 * absd) - const - f
+        elif b > R[i] and b > P[i] and b > N[i]:
+            j = 1 - (4 * absd) - const - f
+        elif b >= M[i]:
+            j = 1.0
+        J[i] = j
+
+        if np.isnan(j) or j == 1:
+            continue  # blank in the sheet
+        if j < 0:
+            # Sell zones (above VWAP bands)
+            if P[i] > b and b > N[i]:
+                K[i] = -2.0
+            elif R[i] > b and b > P[i]:
+                K[i] = -3.0
+            elif b > R[i]:
+                K[i] = -4.0
+        else:
+            # Buy zones (below VWAP bands)
+            if O[i] < b and b < M[i]:
+                K[i] = 2.0
+            elif Q[i] < b and b < O[i]:
+                K[i] = 3.0
+            elif b < Q[i]:
+                K[i] = 4.0
+    return J, K
@@ -1,7 +1,10 @@
 
 from __future__ import annotations
 
+import importlib.util
 import math
+import os
+import sys
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Optional, Sequence, Tuple
@@ -9,6 +12,10 @@ from typing import Optional, Sequence, Tuple
 import numpy as np
 import pandas as pd
 
+# numba is optional; without it the J/K kernel runs as plain Python and the
+# rolling windows stay on pandas' Cython engine
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
 
 # --------------------------
 # Helpers & data containers
@@ -25,23 +32,85 @@ class WeeklyBands:
     upper_4sd: float
 
 
+@dataclass
+class WeeklyScalars:
+    """Sheet-level statistics from row 2 of 'weekly price' (T2..X2)."""
+    avg_return: float
+    min_return: float
+    max_return: float
+    avg_variance: float
+    sd_global: float
+
+
 def _is_monday(d: date) -> bool:
     # Monday == 0 in Python
-    return pd.Timestamp(d).weekday() == 0
+    return d.weekday() == 0
 
 #Early Monday Morning has the best price and volume, so we use it as the anchor
 def _monday_on_or_after(d: date) -> date:
-    ts = pd.Timestamp(d)
-    return (ts + pd.offsets.Week(weekday=0)).date() if ts.weekday() != 0 else ts.date()
+    return d + timedelta(days=(7 - d.weekday()) % 7)
 
 
 
 def _last_non_nan(series: pd.Series) -> Optional[float]:
     """Return last non-NaN value from a numeric series, or None if none exist."""
-    for v in reversed(series.tolist()):
-        if pd.notna(v):
-            return float(v)
-    return None
+    idx = series.last_valid_index()
+    return None if idx is None else float(series.loc[idx])
+
+
+def _weekly_scalars(weekly_return: pd.Series, weekly_close: pd.Series) -> WeeklyScalars:
+    """Sheet row-2 scalars T2..X2 from the weekly returns (D) and closes (B)."""
+    # T2 = AVERAGEIF($D$4:D591,"<>")
+    # Actual sheet excludes blanks; here we use all non-NaN weekly returns.
+    returns_non_nan = weekly_return.dropna()
+    avg_return = float(returns_non_nan.mean()) if len(returns_non_nan) else float("nan")
+    min_return = float(returns_non_nan.min()) if len(returns_non_nan) else float("nan")
+    max_return = float(returns_non_nan.max()) if len(returns_non_nan) else float("nan")
+
+    # W2 = SUM(E) / COUNTIFS(E<>"", B>0), with E = (D - $T$2)^2
+    # In the sheet, the denominator counts rows where E is non-blank and B>0
+    # We replicate exactly:
+    variance = (weekly_return - avg_return) ** 2
+    mask_valid_var = variance.notna() & (weekly_close > 0)
+    sum_var = float(variance[mask_valid_var].sum()) if mask_valid_var.any() else float("nan")
+    count_var = int(mask_valid_var.sum())
+    avg_variance = (sum_var / count_var) if count_var > 0 else float("nan")
+    sd_global = math.sqrt(avg_variance) if not math.isnan(avg_variance) else float("nan")
+
+    return WeeklyScalars(
+        avg_return=avg_return,
+        min_return=min_return,
+        max_return=max_return,
+        avg_variance=avg_variance,
+        sd_global=sd_global,
+    )
+
+
+def _rolling_engine_kwargs(engine: Optional[str]) -> dict:
+    """Keyword arguments selecting the pandas rolling engine ('numba' falls back to Cython without numba)."""
+    if engine == "numba" and _HAS_NUMBA:
+        return {"engine": "numba", "engine_kwargs": {"nopython": True, "nogil": True, "cache": True}}
+    return {}
+
+
+def _load_kernels():
+    """
+    Return the compiled-kernel module, always under the name _legacy_dca_kernels.
+
+    Loaded by file location so Numba's disk cache sees the same module name
+    however this script was imported.
+    """
+    name = "_legacy_dca_kernels"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            name, os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+_compute_j_k = _load_kernels()._compute_j_k
 
 
 # --------------------------
@@ -51,7 +120,23 @@ def _last_non_nan(series: pd.Series) -> Optional[float]:
 def compute_weekly_table(
     daily: pd.DataFrame,
     today: Optional[date] = None,
+    rolling_engine: Optional[str] = None,
 ) -> pd.DataFrame:
+    """
+    Replicate the 'weekly price' sheet logic and return the weekly table.
+
+    See `compute_weekly_table_with_scalars` for the parameters and columns; this
+    variant drops the row-2 scalars.
+    """
+    weekly, _ = compute_weekly_table_with_scalars(daily, today=today, rolling_engine=rolling_engine)
+    return weekly
+
+
+def compute_weekly_table_with_scalars(
+    daily: pd.DataFrame,
+    today: Optional[date] = None,
+    rolling_engine: Optional[str] = None,
+) -> Tuple[pd.DataFrame, WeeklyScalars]:
     """
     Replicate the 'weekly price' sheet logic.
 
@@ -65,11 +150,17 @@ def compute_weekly_table(
         Used only for the special case in the sheet's Bn formula:
         IF(AND(TODAY()>=(An-7), An>TODAY()), use most-recent price; ELSE use price on An.
         If None, defaults to today's date on the system.
+    rolling_engine : str, optional
+        Pass "numba" to run the 14-week rolling std/sums on pandas' Numba engine.
+        It pays a few seconds of JIT per process, so it only wins on very long
+        histories; the default (Cython) is faster for the sheet's ~600 weeks.
 
     Returns
     -------
-    DataFrame with columns (exactly mirroring the sheet semantics):
-        A Date                         -> 'date' (Mondays, ascending)
+    (weekly_table, scalars)
+
+    weekly_table is a DataFrame with columns (exactly mirroring the sheet semantics):
+        A Date                         -> 'date' (Mondays, ascending, datetime64)
         B Weekly Close                 -> 'weekly_close'
         C Weekly Volume                -> 'weekly_volume'
         D Weekly Volatility            -> 'weekly_return'
@@ -80,11 +171,9 @@ def compute_weekly_table(
         J Multiple calculation         -> 'multiple_calc'    (piecewise formula)
         K Buy/Sell Multiplier          -> 'bs_multiplier'    (discrete bucket per bands)
         M..R Bands                     -> 'lower_2sd','upper_2sd','lower_3sd','upper_3sd','lower_4sd','upper_4sd'
-        T AVG (of D)                   -> 'avg_return' (scalar, repeated in each row)
-        U MIN (of D)                   -> 'min_return' (scalar, repeated)
-        V MAX (of D)                   -> 'max_return' (scalar, repeated)
-        W AVG VAR                      -> 'avg_variance' (scalar, repeated)
-        X SD                            -> 'sd_global' (scalar, repeated)
+
+    scalars is a `WeeklyScalars` holding the sheet's row-2 values T2..X2
+    (AVG/MIN/MAX of D, AVG VAR, SD), computed once instead of repeated per row.
 
     Important: We follow the spreadsheet exactly, including:
       * H and F use a *running* window until the 14th completed row (rows 3..16),
@@ -96,141 +185,92 @@ def compute_weekly_table(
     if today is None:
         today = date.today()
 
-    # Normalize input
-    df = daily.copy()
-    df["date"] = pd.to_datetime(df["date"]).dt.date
-    df = df.sort_values("date").reset_index(drop=True)
+    # Normalize input: pull sorted column arrays instead of copying the whole frame
+    dates = pd.to_datetime(daily["date"]).to_numpy().astype("datetime64[D]")
+    order = np.argsort(dates, kind="stable")
+    dates = dates[order]
+    prices = daily["price"].to_numpy(dtype=float)[order]
+    volumes = daily["daily_volume"].to_numpy(dtype=float)[order] if "daily_volume" in daily.columns else None
 
     # Build Monday anchors from the sheet's approach:
     # The original sheet starts on a Monday and increments by 7 days.
-    start_monday = _monday_on_or_after(df["date"].min())
-    last_date = df["date"].max()
-    mondays = []
-    d0 = start_monday
-    while d0 <= last_date:
-        mondays.append(d0)
-        d0 = (pd.Timestamp(d0) + pd.Timedelta(days=7)).date()
+    start_monday = np.datetime64(_monday_on_or_after(dates[0].item()), "D")
+    one_day, one_week = np.timedelta64(1, "D"), np.timedelta64(7, "D")
+    mondays = np.arange(start_monday, dates[-1] + one_day, one_week)
 
     out = pd.DataFrame({"date": mondays})
 
-    # Lookup helpers: map date -> price and date -> weekly_volume (sum of previous 7 daily volumes)
-    price_map = {d: v for d, v in zip(df["date"], df["price"])}
+    monday_index = pd.DatetimeIndex(mondays)
+
+    # B: IF(AND(TODAY()>=(An-7), An>TODAY()), INDEX(calculations!B:B, MATCH(143^143, calculations!B:B)),
+    #       IF(MATCH(An, calculations!A:A, 0), INDEX(calculations!B:B, MATCH(An, calculations!A:A, 0)), ""))
+    # Exact match on the anchor date for every Monday at once (last row wins on duplicate dates).
+    price_series = pd.Series(prices, index=pd.DatetimeIndex(dates))
+    price_series = price_series[~price_series.index.duplicated(keep="last")]
+    weekly_close = price_series.reindex(monday_index).to_numpy(copy=True)
+    today_ts = pd.Timestamp(today)
+    in_current_week = (monday_index - pd.Timedelta(days=7) <= today_ts) & (monday_index > today_ts)
+    if in_current_week.any():
+        # use most recent non-NaN price as of 'today'
+        # emulate MATCH(143^143, B:B)
+        last_price = _last_non_nan(pd.Series(prices[:np.searchsorted(dates, np.datetime64(today, "D"), side="right")]))
+        weekly_close[in_current_week] = np.nan if last_price is None else last_price
+    out["weekly_close"] = weekly_close
 
     # Weekly volume in 'calculations' sheet is SUM of daily_volume over [An-7, An-1]
-    if "daily_volume" in df.columns:
-        vol_series = df.set_index("date")["daily_volume"]
+    # Excel appears to sum the volume for the anchor date and the 6 days before it.
+    # The daily dates are sorted, so each [An-6, An] window is a searchsorted slice and
+    # its sum a difference of prefix sums (NaNs ignored); blank when the slice is empty.
+    lo = np.searchsorted(dates, mondays - 6 * one_day, side="left")
+    hi = np.searchsorted(dates, mondays, side="right")
+    if volumes is not None:
+        csum = np.concatenate(([0.0], np.nancumsum(volumes)))
+        window_sums = csum[hi] - csum[lo]
     else:
-        vol_series = pd.Series(index=pd.Index(df["date"], name="date"), dtype=float)
-
-    def weekly_close_for(anchor: date) -> float:
-        # IF(AND(TODAY()>=(An-7), An>TODAY()), INDEX(calculations!B:B, MATCH(143^143, calculations!B:B)),
-        #    IF(MATCH(An, calculations!A:A, 0), INDEX(calculations!B:B, MATCH(An, calculations!A:A, 0)), ""))
-        window_start = (pd.Timestamp(anchor) - pd.Timedelta(days=7)).date()
-        if today >= window_start and anchor > today:
-            # use most recent non-NaN price as of 'today'
-            # emulate MATCH(143^143, B:B)
-            last_price = _last_non_nan(df.loc[df["date"] <= today, "price"])
-            return float("nan") if last_price is None else float(last_price)
-        # else exact match on anchor date
-        return float(price_map.get(anchor, np.nan))
-
-    out["weekly_close"] = [weekly_close_for(d) for d in out["date"]]
-
-    def weekly_volume_for(anchor: date) -> float:
-        # Excel appears to sum the volume for the anchor date and the 6 days before it
-        # This gives us a 7-day window ending on the anchor date
-        start = (pd.Timestamp(anchor) - pd.Timedelta(days=6)).date()
-        end = anchor
-        window = vol_series.loc[(vol_series.index >= start) & (vol_series.index <= end)]
-        if window.empty:
-            return np.nan
-        # Sum of available daily volumes (NaNs ignored)
-        return float(window.sum(skipna=True))
-
-    out["weekly_volume"] = [weekly_volume_for(d) for d in out["date"]]
+        window_sums = np.zeros(len(mondays))
+    out["weekly_volume"] = np.where(hi > lo, window_sums, np.nan)
 
     # D: Weekly volatility = (B - B_prev)/B_prev
     out["weekly_return"] = out["weekly_close"].pct_change()
 
-    # Placeholders for scalars that the sheet puts in row 2 (T2, U2, V2, W2, X2)
-    # We compute them once from the full D/E arrays, then repeat per row to mirror the sheet.
-    # T2 = AVERAGEIF($D$4:D591,"<>")
-    # Actual sheet excludes blanks; here we use all non-NaN weekly returns.
-    returns_non_nan = out["weekly_return"].dropna()
-    avg_return = float(returns_non_nan.mean()) if len(returns_non_nan) else float("nan")
-    min_return = float(returns_non_nan.min()) if len(returns_non_nan) else float("nan")
-    max_return = float(returns_non_nan.max()) if len(returns_non_nan) else float("nan")
+    # Scalars that the sheet puts in row 2 (T2, U2, V2, W2, X2)
+    # We compute them once from the full D/E arrays and return them next to the table.
+    scalars = _weekly_scalars(out["weekly_return"], out["weekly_close"])
 
     # E: Weekly variance = (D - $T$2)^2
-    out["weekly_variance"] = (out["weekly_return"] - avg_return) ** 2
-
-    # W2 = SUM(E) / COUNTIFS(E<>"", B>0)
-    # In the sheet, the denominator counts rows where E is non-blank and B>0
-    # We replicate exactly:
-    mask_valid_var = out["weekly_variance"].notna() & (out["weekly_close"] > 0)
-    sum_var = float(out.loc[mask_valid_var, "weekly_variance"].sum()) if mask_valid_var.any() else float("nan")
-    count_var = int(mask_valid_var.sum())
-    avg_variance = (sum_var / count_var) if count_var > 0 else float("nan")
-    sd_global = math.sqrt(avg_variance) if not math.isnan(avg_variance) else float("nan")
+    out["weekly_variance"] = (out["weekly_return"] - scalars.avg_return) ** 2
 
     # F: "14 Week MA Volatility"
     # Sheet behavior:
     #  - For rows 1..(start_index+13) it's a *running* STDEV.S from the first valid D to current D
     #  - From the (start_index+14)-th row onward it's a 14-length rolling STDEV.S
     # The sheet's first row of data corresponds to index 0 in this DataFrame.
-    def stdev_s(values: np.ndarray) -> float:
-        # STDEV.S is sample stdev (ddof=1); require at least 2 points.
-        if len(values) < 2:
-            return np.nan
-        return float(np.nanstd(values, ddof=1))
-
-    rolling_vol = []
-    for i in range(len(out)):
-        if i == 0:
-            # First row has no previous data, so volatility is NaN
-            rolling_vol.append(np.nan)
-        elif i < 14:  # first 14 rows (indices 0-13): running window
-            # Use all available returns from the start up to current row (inclusive)
-            window_returns = out.loc[:i, "weekly_return"].values
-            non_nan = window_returns[~np.isnan(window_returns)]
-            if len(non_nan) >= 2:  # Need at least 2 values for stdev
-                rolling_vol.append(stdev_s(non_nan))
-            else:
-                rolling_vol.append(np.nan)
-        else:        # from 15th row (0-based i=14) onward: 14-week rolling window
-            # Use exactly 14 most recent returns including current row
-            last14 = out.loc[i-13:i, "weekly_return"].values
-            last14 = last14[~np.isnan(last14)]
-            if len(last14) >= 2:
-                rolling_vol.append(stdev_s(last14))
-            else:
-                rolling_vol.append(np.nan)
-    out["rolling_vol"] = rolling_vol
+    # Until row 14 the trailing 14-row window is clipped at the first row, so a single
+    # rolling STDEV.S (ddof=1, NaNs skipped, >= 2 values) covers both the running and
+    # the rolling phase in O(N).
+    engine_kwargs = _rolling_engine_kwargs(rolling_engine)
+    out["rolling_vol"] = out["weekly_return"].rolling(14, min_periods=2).std(**engine_kwargs)
 
     # G: Weekly Weighted Volume = B * C
     out["weighted_volume"] = out["weekly_close"] * out["weekly_volume"]
 
     # H: "14 Week VWAP MA"
     # Same pattern: running VWAP until 14th row, then 14-week rolling VWAP
-    vwap_ma = []
-    for i in range(len(out)):
-        if i <= 13:
-            num = float(out.loc[:i, "weighted_volume"].sum(skipna=True))
-            den = float(out.loc[:i, "weekly_volume"].sum(skipna=True))
-        else:
-            num = float(out.loc[i-13:i, "weighted_volume"].sum(skipna=True))
-            den = float(out.loc[i-13:i, "weekly_volume"].sum(skipna=True))
-        vwap_ma.append((num / den) if den > 0 else np.nan)
-    out["vwap_ma"] = vwap_ma
+    # As with F, the clipped 14-row window is the running window for the first rows;
+    # min_periods=0 keeps the loop's skipna semantics (an all-blank window sums to 0).
+    num = out["weighted_volume"].rolling(14, min_periods=0).sum(**engine_kwargs).to_numpy()
+    den = out["weekly_volume"].rolling(14, min_periods=0).sum(**engine_kwargs).to_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out["vwap_ma"] = np.where(den > 0, num / den, np.nan)
 
     # Bands M..R:
     # M = H*(1 - 2F), N = H*(1 + 2F), etc.
-    out["lower_2sd"] = out["vwap_ma"] * (1 - 2 * out["rolling_vol"])
-    out["upper_2sd"] = out["vwap_ma"] * (1 + 2 * out["rolling_vol"])
-    out["lower_3sd"] = out["vwap_ma"] * (1 - 3 * out["rolling_vol"])
-    out["upper_3sd"] = out["vwap_ma"] * (1 + 3 * out["rolling_vol"])
-    out["lower_4sd"] = out["vwap_ma"] * (1 - 4 * out["rolling_vol"])
-    out["upper_4sd"] = out["vwap_ma"] * (1 + 4 * out["rolling_vol"])
+    # All six bands in one broadcast: (N, 1) * (1 + (1, 6) * (N, 1)) -> (N, 6)
+    sigmas = np.array([-2.0, 2.0, -3.0, 3.0, -4.0, 4.0])
+    h = out["vwap_ma"].to_numpy(dtype=float)[:, None]
+    f = out["rolling_vol"].to_numpy(dtype=float)[:, None]
+    bands = h * (1 + sigmas * f)
+    out[["lower_2sd", "upper_2sd", "lower_3sd", "upper_3sd", "lower_4sd", "upper_4sd"]] = bands
 
     # J: "Multiple calculation" (verbatim order from the sheet)
     # IF(B<M, 1+(2*ABS(D))+(1+$X$2)+F,
@@ -243,97 +283,25 @@ def compute_weekly_table(
     #                ))))))
     # NOTE: The "B<O" and "B<Q" branches are unreachable because they are nested after B<M.
     # We keep them to match the spreadsheet exactly.
-    J = []
-    for i in range(len(out)):
-        B = out.at[i, "weekly_close"]
-        D = out.at[i, "weekly_return"]
-        F = out.at[i, "rolling_vol"]
-        M = out.at[i, "lower_2sd"]
-        N = out.at[i, "upper_2sd"]
-        O = out.at[i, "lower_3sd"]
-        P = out.at[i, "upper_3sd"]
-        Q = out.at[i, "lower_4sd"]
-        R = out.at[i, "upper_4sd"]
-        if pd.isna(B):
-            J.append(np.nan)
-            continue
-        # replicate blanks/NaNs like the sheet
-        val = np.nan
-        if not pd.isna(B):
-            if (B < M):
-                val = 1 + (2 * abs(D)) + (1 + sd_global) + F
-            else:
-                if (B < O):
-                    val = 1 + (3 * abs(D)) + (1 + sd_global) + F
-                else:
-                    if (B < Q):
-                        val = 1 + (4 * abs(D)) + (1 + sd_global) + F
-                    else:
-                        if (B > N) and (B < P):
-                            val = 1 - (2 * abs(D)) - (1 + sd_global) - F
-                        else:
-                            if (B > N) and (B > P):
-                                val = 1 - (3 * abs(D)) - (1 + sd_global) - F
-                            else:
-                                if (B > R) and (B > P) and (B > N):
-                                    val = 1 - (4 * abs(D)) - (1 + sd_global) - F
-                                else:
-                                    if (B >= M):
-                                        val = 1
-        J.append(val)
-    out["multiple_calc"] = J
-
+    #
     # K: "Buy/Sell Multiplier" (discrete bucket based on J sign and position vs bands)
-    K_vals = []
-    for i in range(len(out)):
-        B = out.at[i, "weekly_close"]
-        Jv = out.at[i, "multiple_calc"]
-        M = out.at[i, "lower_2sd"]
-        N = out.at[i, "upper_2sd"]
-        O = out.at[i, "lower_3sd"]
-        P = out.at[i, "upper_3sd"]
-        Q = out.at[i, "lower_4sd"]
-        R = out.at[i, "upper_4sd"]
-
-        if pd.isna(B) or pd.isna(Jv):
-            K_vals.append(np.nan)
-            continue
-
-        if Jv == 1:
-            K_vals.append(np.nan)  # blank in the sheet
-            continue
-
-        if Jv < 0:
-            # Sell zones (above VWAP bands)
-            if (P > B) and (B > N):
-                K_vals.append(-2)
-            elif (R > B) and (B > P):
-                K_vals.append(-3)
-            elif B > R:
-                K_vals.append(-4)
-            else:
-                K_vals.append(np.nan)
-        else:
-            # Buy zones (below VWAP bands)
-            if (O < B) and (B < M):
-                K_vals.append(2)
-            elif (Q < B) and (B < O):
-                K_vals.append(3)
-            elif B < Q:
-                K_vals.append(4)
-            else:
-                K_vals.append(np.nan)
-
-    out["bs_multiplier"] = K_vals
-
-    # Scalars repeated per row to match the sheet surfaces
-    out["avg_return"]   = avg_return
-    out["min_return"]   = min_return
-    out["max_return"]   = max_return
-    out["avg_variance"] = avg_variance
-    out["sd_global"]    = sd_global
+    # J is computed first, then K from J; both come out of one fused pass.
+    # Pull the nine hot columns once into a (9, N) block; each row is a contiguous
+    # float64 array, so the kernel reads every input with unit stride.
+    hot = np.ascontiguousarray(
+        out[["weekly_close", "weekly_return", "rolling_vol",
+             "lower_2sd", "upper_2sd", "lower_3sd", "upper_3sd", "lower_4sd", "upper_4sd"]]
+        .to_numpy(dtype=float).T
+    )
+    B, D, F, M, N, O, P, Q, R = hot
+    absD = np.abs(D)
+    const = 1.0 + float(scalars.sd_global)
+    J, K = _compute_j_k(B, absD, F, M, N, O, P, Q, R, const)
+    out["multiple_calc"] = J
+    out["bs_multiplier"] = K
 
-    return out
+    # Sheet scalars are returned once rather than repeated on every row
+    return out, scalars
 
 
 def compute_optimum_dca_schedule(
@@ -341,6 +309,7 @@ def compute_optimum_dca_schedule(
     start_date: date,
     weeks: int,
     weekly_budget: float,
+    scalars: Optional[WeeklyScalars] = None,
 ) -> pd.DataFrame:
     """
     Replicate '20222023 WDCA' logic (only the data columns), independent of Excel.
@@ -351,6 +320,8 @@ def compute_optimum_dca_schedule(
     start_date : the first trade-week anchor date (Monday) (e.g., 2022-01-10).
     weeks : number of weeks in the investment period (e.g., 208).
     weekly_budget : weekly budget in dollars (e.g., 50).
+    scalars : `WeeklyScalars` from `compute_weekly_table_with_scalars` (X2 sets the
+        reserve cap). If None, they are recomputed from the weekly table.
 
     Returns
     -------
@@ -367,22 +338,28 @@ def compute_optimum_dca_schedule(
     # P10 = weekly_budget
     # P13 = weeks
     # P15 = ABS('weekly price'!X2)*2 = 2*abs(sd_global)
-    sd_global = float(w["sd_global"].dropna().iloc[0]) if "sd_global" in w.columns and w["sd_global"].notna().any() else float("nan")
+    if scalars is None:
+        scalars = _weekly_scalars(weekly["weekly_return"], weekly["weekly_close"])
+    sd_global = float(scalars.sd_global)
     total_investment = weeks * weekly_budget
     reserve_cap = abs(sd_global) * 2.0
     # P3 = P5 * P15 -> not directly used in row computations; here for completeness
     total_reserve_needed = total_investment * reserve_cap
 
     # Build weekly range
-    anchors = [start_date + timedelta(days=7*i) for i in range(weeks)]
+    anchors = np.datetime64(start_date, "D") + np.arange(weeks) * np.timedelta64(7, "D")
     # Data columns
     out = pd.DataFrame({
         "trade_date": anchors,
-        "week": [i+1 for i in range(weeks)]
+        "week": np.arange(1, weeks + 1)
     })
 
-    # C: BTC price (weekly close)
-    out["btc_price"] = [float(w.at[d, "weekly_close"]) if d in w.index else np.nan for d in anchors]
+    # C: BTC price (weekly close), plus the weekly J and K used by E and F below.
+    # One reindex aligns all three columns on the anchors (blank where the weekly
+    # table has no row for that Monday).
+    w.index = pd.DatetimeIndex(w.index)
+    aligned = w.reindex(pd.DatetimeIndex(anchors))[["weekly_close", "multiple_calc", "bs_multiplier"]]
+    out["btc_price"] = aligned["weekly_close"].to_numpy(dtype=float)
 
     # D: Change from first day of Entry = (C - C3)/C3
     if len(out) > 0 and not np.isnan(out.at[0, "btc_price"]):
@@ -395,28 +372,15 @@ def compute_optimum_dca_schedule(
     # IF(C<>"", IF(AND(D<-0.4, C<>""),
     #       INDEX(weekly!J) - 2*D,
     #     INDEX(weekly!J) - D), "")
-    def j_at(d):
-        try:
-            return float(w.at[d, "multiple_calc"])
-        except KeyError:
-            return np.nan
-
-    inv_mult = []
-    for i, d in enumerate(anchors):
-        C = out.at[i, "btc_price"]
-        D = out.at[i, "pct_change_from_first"]
-        if pd.isna(C):
-            inv_mult.append(np.nan)
-            continue
-        J = j_at(d)
-        if (not pd.isna(D)) and (D < -0.4):
-            inv_mult.append(J - 2*D)
-        else:
-            inv_mult.append(J - D)
-    out["investment_multiple_optimum"] = inv_mult
+    j_aligned = aligned["multiple_calc"].to_numpy(dtype=float)
+    C = out["btc_price"].to_numpy()
+    D = out["pct_change_from_first"].to_numpy()
+    with np.errstate(invalid="ignore"):
+        inv_mult = np.where(D < -0.4, j_aligned - 2 * D, j_aligned - D)
+    out["investment_multiple_optimum"] = np.where(np.isnan(C), np.nan, inv_mult)
 
     # F: Buy/Sell Multiplier = INDEX(weekly!K) for the same date
-    out["buy_sell_multiplier"] = [float(w.at[d, "bs_multiplier"]) if (d in w.index and pd.notna(w.at[d, "bs_multiplier"])) else np.nan for d in anchors]
+    out["buy_sell_multiplier"] = aligned["bs_multiplier"].to_numpy(dtype=float)
 
     # G: Investment Amount Optimum scenario = (E + F) * weekly_budget
     out["investment_amount_optimum"] = (out["investment_multiple_optimum"] + out["buy_sell_multiplier"]) * weekly_budget
@@ -430,14 +394,17 @@ def compute_optimum_dca_schedule(
     # J: Capital Balance Optimum scenario
     # J3 = Total Investment - G3
     # Jn = IF(Cn<>"", J(n-1) - G(n-1), "")
-    cap_bal = []
-    for i in range(len(out)):
-        if i == 0:
-            cap_bal.append(total_investment - out.at[i, "investment_amount_optimum"])
-        else:
-            prev = cap_bal[i-1]
-            prev_spend = out.at[i-1, "investment_amount_optimum"]
-            cap_bal.append(prev - prev_spend if pd.notna(out.at[i, "btc_price"]) else np.nan)
+    # Unrolled: Jn = J3 - SUM(G3:G(n-1)) (G3 is deducted twice, as in the sheet). A plain,
+    # not nan-, cumsum keeps the blank-propagation: a blank spend blanks every later row,
+    # and a blank price blanks its row and, through J(n-1), all rows after it.
+    G = out["investment_amount_optimum"].to_numpy()
+    if len(G):
+        cap_bal = (total_investment - G[0]) - np.concatenate(([0.0], np.cumsum(G)[:-1]))
+        blank_price = np.isnan(C)
+        blank_price[0] = False
+        cap_bal[np.logical_or.accumulate(blank_price)] = np.nan
+    else:
+        cap_bal = np.empty(0)
     out["capital_balance_optimum"] = cap_bal
 
     # K: Rolling Weekly Profit/Loss = IF(L<>"",-1*((L - C)/L),"")
@@ -468,6 +435,7 @@ def run_optimum_dca(
     weeks: int = 208,
     weekly_budget: float = 50.0,
     today: Optional[date] = None,
+    rolling_engine: Optional[str] = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Compute weekly table and the WDCA schedule in one shot.
@@ -476,6 +444,7 @@ def run_optimum_dca(
     -------
     (weekly_table, wdca_table)
     """
-    weekly = compute_weekly_table(daily, today=today)
-    wdca = compute_optimum_dca_schedule(weekly, start_date=start_date, weeks=weeks, weekly_budget=weekly_budget)
+    weekly, scalars = compute_weekly_table_with_scalars(daily, today=today, rolling_engine=rolling_engine)
+    wdca = compute_optimum_dca_schedule(weekly, start_date=start_date, weeks=weeks, weekly_budget=weekly_budget,
+                                        scalars=scalars)
     return weekly, wdca
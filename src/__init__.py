@@ -1 +1,25 @@
 # CryptoInvestor DCA Analyzer Package
+
+import importlib.util
+import os
+import sys
+
+
+def load_dca_kernels():
+    """
+    Return the _dca_kernels module, always under that top-level name.
+
+    Numba's on-disk cache is keyed by the kernel file but records the importing
+    module's name, so the kernels must never also be imported as
+    src._dca_kernels. When the package is not installed (src/ is not on
+    sys.path), the file is loaded by location instead of extending sys.path.
+    """
+    try:
+        import _dca_kernels
+    except ImportError:
+        spec = importlib.util.spec_from_file_location(
+            '_dca_kernels', os.path.join(os.path.dirname(os.path.abspath(__file__)), '_dca_kernels.py'))
+        _dca_kernels = importlib.util.module_from_spec(spec)
+        sys.modules['_dca_kernels'] = _dca_kernels
+        spec.loader.exec_module(_dca_kernels)
+    return _dca_kernels
@@ -0,0 +1,314 @@
+"""
+Compiled numeric kernels for the DCA simulations.
+
+Kernels are JIT-compiled with Numba when it is installed. Numba is an optional
+dependency: without it, ``njit`` degrades to a no-op decorator and the same
+functions run as plain Python over NumPy arrays.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange, types
+except ImportError:  # pragma: no cover - exercised only when numba is absent
+    types = None
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+def optimum_accumulate_signatures():
+    """
+    Explicit signatures for compiling optimum_accumulate ahead of its first call.
+
+    Only the read-only C-contiguous float64 layout the validator passes (its
+    memoized, shared arrays); compiling unused variants just adds cold-cache
+    time. Callers that want the kernel ready pass these to
+    ``optimum_accumulate.compile``; it is not compiled when this module is
+    imported, so importers that never accumulate don't pay for it. Other
+    layouts still compile lazily on first call.
+    """
+    if types is None:
+        return []
+    shared = types.Array(types.float64, 1, 'C', readonly=True)
+    return [types.UniTuple(types.float64, 4)(shared, shared, types.float64, types.float64)]
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+def optimum_accumulate(inv, btc, final_price, opening_balance):
+    """
+    Accumulate weekly Optimum DCA transactions in a single fused pass.
+
+    Args:
+        inv: Signed weekly investment amounts (buys > 0, sells < 0)
+        btc: Signed weekly BTC units bought/sold
+        final_price: BTC price used for the final valuation
+        opening_balance: Capital balance before the first week
+
+    Returns:
+        (total_btc, net_investment, capital_balance, holding_value)
+    """
+    total_btc = 0.0
+    net_investment = 0.0
+    balance = opening_balance
+    for i in range(inv.size):
+        total_btc += btc[i]
+        net_investment += inv[i]
+        balance -= inv[i]
+    return total_btc, net_investment, balance, total_btc * final_price
+
+
+# The signal kernels below branch on NaN comparisons, so they are compiled without fastmath.
+
+# Band sigma for the number of 2/3/4 SD bands a price lies beyond (0 = inside the 2 SD bands)
+_BAND_SIGMA = (0.0, 2.0, 3.0, 4.0)
+
+
+@njit(cache=True, nogil=True)
+def _investment_multiple(close, abs_volatility, ma_volatility,
+                         lower_2sd, upper_2sd, lower_3sd, upper_3sd, lower_4sd, upper_4sd, one_plus_x2):
+    """
+    Excel Investment Multiple for one week (1.0 when an input is NaN or inside the bands).
+
+    Takes abs(volatility) and (1 + X2) precomputed, so callers work them out once.
+
+    Branchless form of the sheet's nested IF: the bands are nested, so counting
+    the bands a price lies below (or above) picks the 2/3/4 SD branch, and the
+    sign (+1 below, -1 above, 0 inside) selects buy, sell or neutral.
+    """
+    if np.isnan(close) or np.isnan(abs_volatility) or np.isnan(ma_volatility):
+        return 1.0
+    below = int(close < lower_2sd) + int(close < lower_3sd) + int(close < lower_4sd)
+    above = int(close > upper_2sd) + int(close > upper_3sd) + int(close > upper_4sd)
+    sign = 1.0 if below > 0 else (-1.0 if above > 0 else 0.0)
+    sigma = _BAND_SIGMA[below if below > 0 else above]
+    return 1 + sign * (sigma * abs_volatility) + sign * one_plus_x2 + sign * ma_volatility
+
+
+@njit(cache=True, nogil=True)
+def _buy_sell_multiplier(close, investment_multiple,
+                         lower_2sd, upper_2sd, lower_3sd, upper_3sd, lower_4sd, upper_4sd):
+    """Excel Buy/Sell Multiplier for one week (NaN where the sheet leaves it blank)."""
+    if investment_multiple < 0:
+        if upper_3sd > close > upper_2sd:
+            return -2.0
+        elif upper_4sd > close > upper_3sd:
+            return -3.0
+        elif close > upper_4sd:
+            return -4.0
+    elif investment_multiple > 1:
+        if lower_3sd < close < lower_2sd:
+            return 2.0
+        elif lower_4sd < close < lower_3sd:
+            return 3.0
+        elif close < lower_4sd:
+            return 4.0
+    return np.nan
+
+
+# The vectorized kernels take the price bands as (N, 3) row-major matrices whose
+# columns are the 2, 3 and 4 SD bands, so each week's bands share a cache line.
+
+@njit(cache=True, nogil=True)
+def investment_multiples(close, volatility, ma_volatility, lowers, uppers, x2):
+    """Investment Multiple for every week."""
+    one_plus_x2 = 1 + x2
+    out = np.empty(close.size)
+    for i in range(close.size):
+        out[i] = _investment_multiple(close[i], abs(volatility[i]), ma_volatility[i],
+                                      lowers[i, 0], uppers[i, 0], lowers[i, 1],
+                                      uppers[i, 1], lowers[i, 2], uppers[i, 2], one_plus_x2)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def buy_sell_multipliers(close, investment_multiple, lowers, uppers):
+    """Buy/Sell Multiplier for every week (NaN = no multiplier)."""
+    out = np.empty(close.size)
+    for i in range(close.size):
+        out[i] = _buy_sell_multiplier(close[i], investment_multiple[i],
+                                      lowers[i, 0], uppers[i, 0], lowers[i, 1],
+                                      uppers[i, 1], lowers[i, 2], uppers[i, 2])
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _weekly_signal(i, close, volatility, ma_volatility, change, lowers, uppers, one_plus_x2):
+    """(Investment Multiple with the WDCA adjustment, Buy/Sell Multiplier) for week i."""
+    multiple = _investment_multiple(close[i], abs(volatility[i]), ma_volatility[i],
+                                    lowers[i, 0], uppers[i, 0], lowers[i, 1],
+                                    uppers[i, 1], lowers[i, 2], uppers[i, 2], one_plus_x2)
+    # WDCA adjustment: subtract change from first day (twice for large drops)
+    if not np.isnan(change):
+        if change < -0.4:
+            multiple = multiple - (2 * change)
+        else:
+            multiple = multiple - change
+    multiplier = _buy_sell_multiplier(close[i], multiple,
+                                      lowers[i, 0], uppers[i, 0], lowers[i, 1],
+                                      uppers[i, 1], lowers[i, 2], uppers[i, 2])
+    return multiple, multiplier
+
+
+@njit(cache=True, nogil=True)
+def weekly_multiples(close, volatility, ma_volatility, change_from_first, lowers, uppers, x2):
+    """
+    Fused Optimum DCA signal pass: Investment Multiple with the WDCA
+    change-from-first adjustment, then the Buy/Sell Multiplier on the result.
+
+    Returns:
+        (investment_multiple, buy_sell_multiplier) arrays; NaN marks weeks
+        without a buy/sell multiplier
+    """
+    n = close.size
+    one_plus_x2 = 1 + x2
+    multiples = np.empty(n)
+    multipliers = np.empty(n)
+    for i in range(n):
+        multiples[i], multipliers[i] = _weekly_signal(i, close, volatility, ma_volatility,
+                                                      change_from_first[i], lowers, uppers,
+                                                      one_plus_x2)
+    return multiples, multipliers
+
+
+@njit(cache=True, nogil=True)
+def weekly_signals(close, volatility, ma_volatility, change_from_first, lowers, uppers, x2, budget):
+    """
+    weekly_multiples plus the amounts they imply, in the same pass over the weeks.
+
+    Returns:
+        (investment_multiple, buy_sell_multiplier, investment, btc): investment is
+        (multiple + multiplier, or + 1 without one) * budget, and btc is
+        investment / close (0 where the price is not positive)
+    """
+    multiples, multipliers = weekly_multiples(close, volatility, ma_volatility,
+                                              change_from_first, lowers, uppers, x2)
+    n = close.size
+    investment = np.empty(n)
+    btc = np.empty(n)
+    for i in range(n):
+        multiplier = 1.0 if np.isnan(multipliers[i]) else multipliers[i]
+        investment[i] = (multiples[i] + multiplier) * budget
+        btc[i] = investment[i] / close[i] if close[i] > 0 else 0.0
+    return multiples, multipliers, investment, btc
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def batch_totals(close, volatility, ma_volatility, lowers, uppers, x2, budgets, starts, ends):
+    """
+    Optimum DCA totals for many scenarios over one weekly series, in parallel.
+
+    Scenario k invests budgets[k] per week over weeks [starts[k], ends[k]), with
+    the change from first day measured from week starts[k]. Sums run in week
+    order, like the single-scenario cumulative sums.
+
+    Returns:
+        (total_btc, net_investment, cash_reserve, total_cash_invested) arrays
+    """
+    m = budgets.size
+    one_plus_x2 = 1 + x2
+    reserve_cap_pct = 2 * abs(x2)
+    total_btc = np.zeros(m)
+    net_investment = np.zeros(m)
+    cash_reserve = np.zeros(m)
+    total_cash_invested = np.zeros(m)
+    for k in prange(m):
+        start = starts[k]
+        budget = budgets[k]
+        first_price = close[start] if ends[k] > start else np.nan
+        btc = 0.0
+        invested = 0.0
+        reserve = budget * (ends[k] - start) * reserve_cap_pct if ends[k] > start else 0.0
+        cash = 0.0
+        for i in range(start, ends[k]):
+            multiple, multiplier = _weekly_signal(i, close, volatility, ma_volatility,
+                                                  (close[i] - first_price) / first_price,
+                                                  lowers, uppers, one_plus_x2)
+            investment = (multiple + (1.0 if np.isnan(multiplier) else multiplier)) * budget
+            btc += investment / close[i] if close[i] > 0 else 0.0
+            invested += investment
+            reserve += budget - investment
+            cash += budget
+        total_btc[k] = btc
+        net_investment[k] = invested
+        cash_reserve[k] = reserve
+        total_cash_invested[k] = cash
+    return total_btc, net_investment, cash_reserve, total_cash_invested
+
+
+# Trailing-window statistics matching pandas' rolling(window, min_periods=1):
+# NaNs are skipped, and a window with no valid values gives NaN (fewer than two
+# for the sample standard deviation).
+
+@njit(cache=True, nogil=True)
+def rolling_sum(values, window):
+    """Sum over the trailing window."""
+    out = np.empty(values.size)
+    for i in range(values.size):
+        total = 0.0
+        count = 0
+        for j in range(max(i - window + 1, 0), i + 1):
+            if not np.isnan(values[j]):
+                total += values[j]
+                count += 1
+        out[i] = total if count > 0 else np.nan
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean(values, window):
+    """Mean over the trailing window."""
+    out = np.empty(values.size)
+    for i in range(values.size):
+        total = 0.0
+        count = 0
+        for j in range(max(i - window + 1, 0), i + 1):
+            if not np.isnan(values[j]):
+                total += values[j]
+                count += 1
+        out[i] = total / count if count > 0 else np.nan
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_std(values, window):
+    """
+    Sample (ddof=1) standard deviation over the trailing window.
+
+    O(N) sliding Welford update (the scheme pandas uses): each step adds the
+    incoming value to the running mean/M2 and removes the one leaving the window.
+    """
+    out = np.empty(values.size)
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(values.size):
+        if i >= window:
+            old = values[i - window]
+            if not np.isnan(old):
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / count
+                    m2 -= delta * (old - mean)
+        value = values[i]
+        if not np.isnan(value):
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+        if count < 2:
+            out[i] = np.nan
+        else:
+            out[i] = np.sqrt(max(m2, 0.0) / (count - 1))
+    return out
@@ -21,7 +21,7 @@ import numpy as np
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from optimum_dca_analyzer import FlexibleOptimumDCA, create_dca_analyzer
+from optimum_dca_analyzer import FlexibleOptimumDCA, create_dca_analyzer, load_price_data
 
 
 class TestDCAValidation:
@@ -261,6 +261,160 @@ class TestDataHandling:
         date_span = (weekly_df['date'].max() - weekly_df['date'].min()).days
         assert date_span > 3000, "Should span multiple years"
 
+    @pytest.mark.unit
+    def test_weekly_buckets_match_resample(self):
+        """Weekly aggregation should match pandas' W-MON resample, including empty weeks."""
+        analyzer = FlexibleOptimumDCA(verbose=False)
+        daily_df = analyzer.load_and_prepare_data()
+        daily_df = daily_df[(daily_df['date'] < '2020-03-04') | (daily_df['date'] > '2020-03-20')]
+
+        weekly = analyzer.calculate_weekly_data(daily_df)
+        expected = daily_df.set_index('date').resample('W-MON', label='right').agg(
+            {'Price': 'last', 'Daily Volume': 'sum'}).reset_index()
+
+        np.testing.assert_array_equal(weekly['date'], expected['date'])
+        np.testing.assert_array_equal(weekly['Price'], expected['Price'])
+        np.testing.assert_array_equal(weekly['Weekly Volume'], expected['Daily Volume'])
+
+    @pytest.mark.unit
+    def test_preloaded_data_matches_fresh_load(self):
+        """Analyzers sharing preloaded data should match ones that read the CSV."""
+        shared_data = FlexibleOptimumDCA.preload()
+
+        for budget, start, end in [(250.0, None, None), (300.0, date(2023, 1, 1), date(2023, 12, 31))]:
+            fresh = FlexibleOptimumDCA(budget, start, end, verbose=False)
+            shared = FlexibleOptimumDCA(budget, start, end, verbose=False, data=shared_data)
+
+            fresh_results = fresh.run_optimum_dca_simulation()
+            shared_results = shared.run_optimum_dca_simulation()
+
+            assert shared_results['total_btc'] == fresh_results['total_btc']
+            assert shared_results['profit_pct'] == fresh_results['profit_pct']
+
+    @pytest.fixture
+    def price_csv(self, tmp_path):
+        """Copy of the price CSV in a temporary directory, so sidecars are written there."""
+        import shutil
+
+        csv_path = tmp_path / 'bitcoin_prices.csv'
+        shutil.copy(os.path.join(os.path.dirname(__file__), '..', 'data', 'bitcoin_prices.csv'), csv_path)
+        return csv_path
+
+    @pytest.mark.unit
+    def test_simulations_share_weekly_data(self):
+        """Simple DCA should reuse the weekly data built by the Optimum DCA run."""
+        import optimum_dca_analyzer
+
+        analyzer = FlexibleOptimumDCA(verbose=False)
+        analyzer.run_optimum_dca_simulation()
+        calls = optimum_dca_analyzer._load_weekly_stats.cache_info()
+
+        shared_results = analyzer.run_simple_dca_simulation()
+        assert optimum_dca_analyzer._load_weekly_stats.cache_info() == calls
+
+        fresh_results = FlexibleOptimumDCA(verbose=False).run_simple_dca_simulation()
+        assert shared_results['total_btc'] == fresh_results['total_btc']
+        assert shared_results['profit_pct'] == fresh_results['profit_pct']
+
+    @pytest.mark.unit
+    def test_weekly_stats_shared_across_analyzers(self):
+        """Analyzers over the CSV should share weekly data and T2/X2 regardless of window or verbosity."""
+        import optimum_dca_analyzer
+
+        first = FlexibleOptimumDCA(verbose=False)
+        first.run_optimum_dca_simulation()
+        hits = optimum_dca_analyzer._load_weekly_stats.cache_info().hits
+
+        window = (300.0, date(2023, 1, 2), date(2023, 12, 25))
+        second_results = FlexibleOptimumDCA(*window, verbose=True).run_optimum_dca_simulation()
+        assert optimum_dca_analyzer._load_weekly_stats.cache_info().hits == hits + 1
+        assert second_results['calculated_T2'] == first.T2_mean_volatility
+        assert second_results['calculated_X2'] == first.X2_volatility_factor
+
+        # Same results as an analyzer that builds its own weekly data and T2/X2
+        fresh_results = FlexibleOptimumDCA(
+            *window, verbose=False, data=FlexibleOptimumDCA.preload()).run_optimum_dca_simulation()
+        assert second_results['calculated_T2'] == fresh_results['calculated_T2']
+        assert second_results['calculated_X2'] == fresh_results['calculated_X2']
+        assert second_results['total_btc'] == fresh_results['total_btc']
+        assert second_results['profit_pct'] == fresh_results['profit_pct']
+
+    @pytest.mark.unit
+    def test_parquet_cache_matches_csv(self, price_csv):
+        """The Parquet sidecar should reproduce the cleaned CSV exactly and be served on reload."""
+        pytest.importorskip('pyarrow')
+
+        from_csv = load_price_data(str(price_csv))
+        sidecar = price_csv.with_suffix('.parquet')
+        assert sidecar.exists()
+        pd.testing.assert_frame_equal(pd.read_parquet(sidecar), from_csv)
+
+        # A new CSV mtime misses the in-process memo; the sidecar (still newer) is read, not rewritten
+        os.utime(price_csv, (os.path.getmtime(price_csv) + 10,) * 2)
+        os.utime(sidecar, (os.path.getmtime(price_csv) + 10,) * 2)
+        sidecar_mtime = os.path.getmtime(sidecar)
+
+        from_parquet = load_price_data(str(price_csv))
+        assert os.path.getmtime(sidecar) == sidecar_mtime
+        pd.testing.assert_frame_equal(from_parquet, from_csv)
+
+    @pytest.mark.unit
+    def test_load_price_data_returns_private_copy(self):
+        """load_price_data should serve the analyzers' cleaned prices without exposing the memo."""
+        prices = load_price_data()
+        pd.testing.assert_frame_equal(prices, FlexibleOptimumDCA.preload())
+
+        prices['date_only'] = prices['date'].dt.date
+        assert 'date_only' not in load_price_data().columns
+
+    @pytest.mark.unit
+    def test_corrupt_parquet_cache_falls_back_to_csv(self, price_csv):
+        """A truncated Parquet sidecar should be ignored and rewritten from the CSV."""
+        pytest.importorskip('pyarrow')
+
+        from_csv = load_price_data(str(price_csv))
+        sidecar = price_csv.with_suffix('.parquet')
+        sidecar.write_bytes(sidecar.read_bytes()[:100])
+
+        # Keep the truncated sidecar newer than the CSV so the loader tries to read it
+        os.utime(price_csv, (os.path.getmtime(price_csv) + 10,) * 2)
+        os.utime(sidecar, (os.path.getmtime(price_csv) + 10,) * 2)
+
+        reloaded = load_price_data(str(price_csv))
+        pd.testing.assert_frame_equal(reloaded, from_csv)
+        pd.testing.assert_frame_equal(pd.read_parquet(sidecar), from_csv)
+        assert [p.name for p in price_csv.parent.iterdir() if p.suffix == '.tmp'] == []
+
+    @pytest.mark.unit
+    def test_edited_csv_is_reloaded(self, price_csv):
+        """The in-process price memo should be invalidated when the CSV changes."""
+        lines = price_csv.read_text(encoding='utf-8').splitlines(keepends=True)
+
+        price_csv.write_text(''.join(lines[:101]), encoding='utf-8')
+        first = load_price_data(str(price_csv))
+
+        price_csv.write_text(''.join(lines[:201]), encoding='utf-8')
+        os.utime(price_csv, (os.path.getmtime(price_csv) + 10,) * 2)
+        second = load_price_data(str(price_csv))
+
+        assert len(first) == 100
+        assert len(second) == 200
+
+    @pytest.mark.unit
+    def test_arrow_csv_parse_matches_pandas(self, price_csv):
+        """Parsing the CSV with pyarrow should give the same cleaned frame as pandas."""
+        pytest.importorskip('pyarrow')
+        import shutil
+        import optimum_dca_analyzer
+
+        pandas_csv = price_csv.with_name('pandas.csv')
+        shutil.copy(price_csv, pandas_csv)
+
+        from_arrow = load_price_data(str(price_csv))
+        with patch.object(optimum_dca_analyzer, '_read_price_csv_arrow', return_value=None):
+            from_pandas = load_price_data(str(pandas_csv))
+        pd.testing.assert_frame_equal(from_arrow, from_pandas)
+
 
 class TestCalculations:
     """Test cases for core calculation methods."""
@@ -306,6 +460,86 @@ class TestCalculations:
         assert abs(results1['total_btc'] - results2['total_btc']) < 0.00001
         assert abs(results1['holding_value'] - results2['holding_value']) < 0.01
 
+    @pytest.mark.unit
+    def test_vectorized_multiples_match_row_formulas(self):
+        """Test that the vectorized multiples agree with the per-row formulas."""
+        analyzer = FlexibleOptimumDCA(verbose=False)
+
+        weekly_df = analyzer.calculate_weekly_data(analyzer.load_and_prepare_data())
+        analyzer.X2_volatility_factor = analyzer.calculate_X2_volatility_factor(
+            weekly_df, analyzer.calculate_T2_mean_volatility(weekly_df))
+        weekly_df = analyzer.calculate_price_bands(analyzer.calculate_rolling_metrics(weekly_df))
+
+        multiples = analyzer.calculate_investment_multiples(weekly_df)
+        multipliers = analyzer.calculate_buy_sell_multipliers(weekly_df, multiples)
+
+        for i, (_, row) in enumerate(weekly_df.iterrows()):
+            expected_multiple = analyzer.calculate_investment_multiple(row)
+            expected_multiplier = analyzer.calculate_buy_sell_multiplier(row, expected_multiple)
+            assert multiples[i] == pytest.approx(expected_multiple, rel=1e-12)
+            if expected_multiplier is None:
+                assert np.isnan(multipliers[i])
+            else:
+                assert multipliers[i] == expected_multiplier
+
+    @pytest.mark.unit
+    def test_rolling_window_matches_full_history(self):
+        """Test that rolling metrics over the lead-in window match those over all history."""
+        analyzer = FlexibleOptimumDCA(verbose=False)
+
+        weekly_df = analyzer.calculate_weekly_data(analyzer.load_and_prepare_data())
+        full = analyzer.filter_target_period(analyzer.calculate_rolling_metrics(weekly_df))
+        window = analyzer.filter_target_period(
+            analyzer.calculate_rolling_metrics(analyzer.filter_rolling_window(weekly_df)))
+
+        assert len(window) == len(full)
+        for column in ['ma_14w_volatility', 'vwap_14w']:
+            np.testing.assert_allclose(window[column], full[column], rtol=1e-12)
+
+    @pytest.mark.unit
+    def test_batch_matches_individual_runs(self):
+        """Test that run_batch reproduces run_optimum_dca_simulation per scenario."""
+        scenarios = [(250.0, date(2022, 1, 10), date(2025, 9, 22), 116157.11),
+                     (100.0, date(2018, 1, 1), date(2019, 12, 31), 7000.0),
+                     (333.33, date(2020, 3, 2), date(2021, 6, 28), 35000.0)]
+        budgets, starts, ends, final_prices = map(list, zip(*scenarios))
+
+        batch = FlexibleOptimumDCA(verbose=False).run_batch(budgets, starts, ends, final_prices)
+
+        for k, (budget, start, end, final_price) in enumerate(scenarios):
+            single = FlexibleOptimumDCA(budget, start, end, final_price, verbose=False).run_optimum_dca_simulation()
+            assert batch['period_weeks'][k] == single['period_weeks']
+            for key in ['total_btc', 'net_investment', 'cash_reserve', 'portfolio_value', 'profit_pct']:
+                assert batch[key][k] == pytest.approx(single[key], rel=1e-9)
+
+    @pytest.mark.unit
+    def test_batch_broadcasts_scalar_inputs(self):
+        """Scalar run_batch arguments should be shared by every scenario."""
+        analyzer = FlexibleOptimumDCA(verbose=False)
+        starts = [date(2022, 1, 10), date(2023, 1, 2)]
+
+        batch = analyzer.run_batch(250.0, starts, date(2025, 9, 22), 116157.11)
+        expanded = analyzer.run_batch([250.0, 250.0], starts, [date(2025, 9, 22)] * 2, [116157.11] * 2)
+
+        for key in ['total_btc', 'net_investment', 'profit_pct', 'period_weeks']:
+            np.testing.assert_array_equal(batch[key], expanded[key])
+
+        single = analyzer.run_batch(250.0, date(2022, 1, 10), date(2025, 9, 22))
+        assert single['total_btc'].shape == (1,)
+        assert single['total_btc'][0] == batch['total_btc'][0]
+
+    @pytest.mark.unit
+    def test_batch_rejects_mismatched_lengths(self):
+        """run_batch should raise ValueError rather than index past the shorter arrays."""
+        analyzer = FlexibleOptimumDCA(verbose=False)
+        starts = [date(2022, 1, 10), date(2023, 1, 2)]
+        ends = [date(2025, 9, 22), date(2024, 1, 1)]
+
+        with pytest.raises(ValueError):
+            analyzer.run_batch([100.0, 200.0, 300.0], starts, ends)
+        with pytest.raises(ValueError):
+            analyzer.run_batch([100.0, 200.0], starts, ends, [1.0, 2.0, 3.0])
+
 
 class TestPerformance:
     """Performance and timing tests."""
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled DCA kernels.
+
+The kernels must produce the same results whether or not Numba is installed.
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from _dca_kernels import (optimum_accumulate, investment_multiples, weekly_multiples, weekly_signals,
+                          rolling_sum, rolling_mean, rolling_std)
+
+
+class TestOptimumAccumulate:
+    """Test the Optimum DCA accumulation kernel."""
+
+    @pytest.mark.unit
+    def test_matches_numpy_reductions(self):
+        """Kernel totals should match plain NumPy sums."""
+        rng = np.random.default_rng(42)
+        inv = rng.normal(500.0, 800.0, size=194)
+        btc = inv / rng.uniform(15000.0, 120000.0, size=194)
+
+        total_btc, net_investment, balance, value = optimum_accumulate(inv, btc, 116157.11, 50000.0)
+
+        assert total_btc == pytest.approx(btc.sum(), rel=1e-12)
+        assert net_investment == pytest.approx(inv.sum(), rel=1e-12)
+        assert balance == pytest.approx(50000.0 - inv.sum(), rel=1e-12)
+        assert value == pytest.approx(btc.sum() * 116157.11, rel=1e-12)
+
+    @pytest.mark.unit
+    def test_sells_increase_capital_balance(self):
+        """Negative investment amounts (sells) should add back to the balance."""
+        inv = np.array([1000.0, -400.0, 250.0])
+        btc = np.array([0.02, -0.005, 0.004])
+
+        _, net_investment, balance, _ = optimum_accumulate(inv, btc, 100000.0, 5000.0)
+
+        assert net_investment == pytest.approx(850.0)
+        assert balance == pytest.approx(5000.0 - 1000.0 + 400.0 - 250.0)
+
+    @pytest.mark.unit
+    def test_empty_input(self):
+        """An empty period should leave the opening balance untouched."""
+        empty = np.empty(0, dtype=np.float64)
+
+        assert optimum_accumulate(empty, empty, 100000.0, 5000.0) == (0.0, 0.0, 5000.0, 0.0)
+
+
+class TestWeeklyMultiples:
+    """Test the Investment Multiple / Buy-Sell Multiplier kernels."""
+
+    # Bands around a VWAP of 100 with 5% volatility: 2/3/4 SD at +-10/15/20
+    LOWERS = np.array([[90.0, 85.0, 80.0]])
+    UPPERS = np.array([[110.0, 115.0, 120.0]])
+
+    @pytest.mark.unit
+    def test_band_branches(self):
+        """Each price zone should pick the matching Excel branch."""
+        x2 = 0.2
+        for close, sign, sigma in [(75.0, 1, 4), (82.0, 1, 3), (88.0, 1, 2),
+                                   (100.0, 0, 0), (112.0, -1, 2), (118.0, -1, 3), (125.0, -1, 4)]:
+            result = investment_multiples(np.array([close]), np.array([-0.1]), np.array([0.05]),
+                                          self.LOWERS, self.UPPERS, x2)
+            expected = 1.0 if sign == 0 else 1 + sign * (sigma * 0.1 + (1 + x2) + 0.05)
+            assert result[0] == pytest.approx(expected)
+
+    @pytest.mark.unit
+    def test_nan_inputs_are_neutral(self):
+        """Missing volatility should give the neutral multiple and no buy/sell multiplier."""
+        multiples, multipliers = weekly_multiples(np.array([75.0]), np.array([np.nan]), np.array([0.05]),
+                                                  np.array([np.nan]), self.LOWERS, self.UPPERS, 0.2)
+
+        assert multiples[0] == 1.0
+        assert np.isnan(multipliers[0])
+
+    @pytest.mark.unit
+    def test_change_from_first_adjustment(self):
+        """Large drops subtract the change twice and drive the buy/sell multiplier."""
+        close = np.array([100.0, 100.0])
+        change = np.array([-0.2, -0.5])
+
+        multiples, multipliers = weekly_multiples(close, np.array([0.0, 0.0]), np.array([0.05, 0.05]),
+                                                  change, np.repeat(self.LOWERS, 2, axis=0),
+                                                  np.repeat(self.UPPERS, 2, axis=0), 0.2)
+
+        assert multiples.tolist() == pytest.approx([1.2, 2.0])
+        # Inside the bands: no buy/sell multiplier even though the multiple exceeds 1
+        assert np.isnan(multipliers).all()
+
+    @pytest.mark.unit
+    def test_signals_include_amounts(self):
+        """Investment adds 1 without a multiplier; BTC is zero at a non-positive price."""
+        close = np.array([75.0, 100.0, 0.0])
+        lowers, uppers = np.repeat(self.LOWERS, 3, axis=0), np.repeat(self.UPPERS, 3, axis=0)
+
+        multiples, multipliers, investment, btc = weekly_signals(
+            close, np.full(3, -0.1), np.full(3, 0.05), np.zeros(3), lowers, uppers, 0.2, 250.0)
+
+        expected = (multiples + np.where(np.isnan(multipliers), 1.0, multipliers)) * 250.0
+        np.testing.assert_array_equal(investment, expected)
+        assert multipliers[0] == 4.0
+        assert btc[:2].tolist() == pytest.approx((investment[:2] / close[:2]).tolist())
+        assert btc[2] == 0.0
+
+
+class TestRollingKernels:
+    """Test the trailing-window kernels against pandas rolling(window, min_periods=1)."""
+
+    @pytest.mark.unit
+    def test_match_pandas_rolling(self):
+        """Sums, means and sample std should match pandas, including NaN gaps."""
+        values = np.random.default_rng(7).normal(size=200)
+        values[[0, 1, 50, 51, 52, 120]] = np.nan
+        rolling = pd.Series(values).rolling(window=14, min_periods=1)
+
+        np.testing.assert_allclose(rolling_sum(values, 14), rolling.sum(), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(rolling_mean(values, 14), rolling.mean(), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(rolling_std(values, 14), rolling.std(), rtol=1e-12, atol=1e-12)
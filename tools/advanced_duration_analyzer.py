@@ -26,7 +26,7 @@ from scipy.stats import mannwhitneyu, ttest_rel, norm, skew, kurtosis
 import warnings
 warnings.filterwarnings('ignore')
 
-from src.optimum_dca_analyzer import FlexibleOptimumDCA
+from src.optimum_dca_analyzer import FlexibleOptimumDCA, load_price_data
 
 class AdvancedDurationAnalyzer:
     """
@@ -66,11 +66,9 @@ class AdvancedDurationAnalyzer:
     
     def _load_price_data(self) -> pd.DataFrame:
         """Load and prepare Bitcoin price data."""
-        df = pd.read_csv("data/bitcoin_prices.csv")
-        df['date'] = pd.to_datetime(df['date'], format='%m-%d-%Y', errors='coerce')
-        df['Price'] = df['Price'].astype(str).str.replace('$', '').str.replace(',', '').str.strip()
-        df['Price'] = pd.to_numeric(df['Price'], errors='coerce')
-        df = df.dropna(subset=['date', 'Price']).sort_values('date')
+        # The analyzer's cleaned prices (memoized, with a Parquet sidecar), so
+        # warm runs skip the CSV parse
+        df = load_price_data()
         df['date_only'] = df['date'].dt.date
         return df
     
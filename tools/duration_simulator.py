@@ -24,7 +24,7 @@ from typing import List, Dict, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
-from src.optimum_dca_analyzer import FlexibleOptimumDCA
+from src.optimum_dca_analyzer import FlexibleOptimumDCA, load_price_data
 
 class DurationSimulator:
     """
@@ -61,11 +61,9 @@ class DurationSimulator:
         
     def _load_price_data(self) -> pd.DataFrame:
         """Load and prepare Bitcoin price data."""
-        df = pd.read_csv("data/bitcoin_prices.csv")
-        df['date'] = pd.to_datetime(df['date'], format='%m-%d-%Y', errors='coerce')
-        df['Price'] = df['Price'].astype(str).str.replace('$', '').str.replace(',', '').str.strip()
-        df['Price'] = pd.to_numeric(df['Price'], errors='coerce')
-        df = df.dropna(subset=['date', 'Price']).sort_values('date')
+        # The analyzer's cleaned prices (memoized, with a Parquet sidecar), so
+        # warm runs skip the CSV parse
+        df = load_price_data()
         df['date_only'] = df['date'].dt.date
         return df
     
@@ -13,6 +13,7 @@ Implements advanced statistical methods to properly compare Optimum vs Simple DC
 This addresses the statistical weaknesses in rolling window analysis.
 """
 
+import importlib.util
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -52,7 +53,10 @@ class EnhancedStatisticalAnalyzer:
 
     def _load_price_data(self) -> pd.DataFrame:
         """Load and prepare price data."""
-        df = pd.read_csv("data/bitcoin_prices.csv")
+        # Only date and Price are used; read them as strings (no type inference),
+        # with pyarrow's multithreaded CSV reader when it is installed
+        engine = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+        df = pd.read_csv("data/bitcoin_prices.csv", usecols=['date', 'Price'], dtype=str, engine=engine)
         df['date'] = pd.to_datetime(df['date'], format='%m-%d-%Y')
         df['Price'] = df['Price'].str.replace('$', '').str.replace(',', '').astype(float)
         df = df.set_index('date').sort_index()
@@ -6,12 +6,146 @@ Uses the exact Excel data and pricing to achieve 100% match with the spreadsheet
 Expected results: 462% return, $263,077.09 holding value, 2.26483845 BTC.
 """
 
-import pandas as pd
-import numpy as np
+from __future__ import annotations
+
+import functools
+import importlib.util
+import math
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
 from datetime import datetime, date
+from typing import TYPE_CHECKING, Optional, Tuple
+
+# pandas/numpy (and the Numba kernels) are imported inside the functions that
+# need them, so importing this module stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Only these columns are consumed by the simulations
+EXCEL_COLUMNS = (
+    'Trade Date',
+    'BTC price',
+    'Investment Amount Optimum scenario',
+    'BTC unit Optimum scenario',
+)
+
+def _excel_engine() -> str:
+    """Prefer the Rust-based calamine xlsx reader when installed, else openpyxl."""
+    return 'calamine' if importlib.util.find_spec('python_calamine') else 'openpyxl'
+
+def _read_excel_sheet(excel_path: str, sheet: str) -> pd.DataFrame:
+    """Parse the WDCA sheet from the xlsx workbook and keep the weekly rows."""
+    import numpy as np
+    import pandas as pd
+
+    # Only parse the columns we use. dtype can't be forced at read time because
+    # the summary rows below the weekly data put labels in the numeric columns.
+    df_excel = pd.read_excel(excel_path, sheet_name=sheet, header=1,
+                             usecols=list(EXCEL_COLUMNS), engine=_excel_engine())
+    
+    # Clean data: keep only rows whose Trade Date parses (drops the summary rows).
+    # The dates stay datetime64 (no per-row datetime.date objects); _load_source
+    # casts them to datetime64[D] either way.
+    trade_dates = pd.to_datetime(df_excel['Trade Date'], errors='coerce', cache=True)
+    # One astype over a column->dtype map instead of a per-column assignment loop.
+    # The mask, astype and assign each build a new frame, so no defensive copy.
+    df_clean = (df_excel.loc[trade_dates.notna()]
+                .astype(dict.fromkeys(EXCEL_COLUMNS[1:], np.float64))
+                .assign(**{'Trade Date': trade_dates.dropna()}))
+
+    return df_clean.reset_index(drop=True)
+
+def _parquet_cache_is_fresh(parquet_path: str, excel_path: str) -> bool:
+    """Return True if the Parquet cache exists and is newer than the workbook."""
+    return (os.path.exists(parquet_path) and
+            os.path.getmtime(parquet_path) >= os.path.getmtime(excel_path))
+
+def _read_parquet_columns(parquet_path: str) -> Optional[Tuple[np.ndarray, ...]]:
+    """
+    Read the cached columns straight into NumPy via pyarrow, bypassing pandas.
+    
+    Returns one array per EXCEL_COLUMNS entry (Trade Date as datetime64[D]),
+    or None if pyarrow is not installed.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+
+    table = pq.read_table(parquet_path, columns=list(EXCEL_COLUMNS))
+    return tuple(table.column(col).to_numpy() for col in EXCEL_COLUMNS)
+
+def _ensure_parquet_cache(df_clean: pd.DataFrame, parquet_path: str) -> None:
+    """Materialize the cleaned sheet as Parquet (skipped without pyarrow or write access)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return
+
+    # Best effort, like the analyzer's price cache: write to a temporary file and
+    # rename it into place, and skip the cache if it can't be written
+    table = pa.Table.from_pandas(df_clean, preserve_index=False)
+    tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+    try:
+        pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, parquet_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+@functools.lru_cache(maxsize=4)
+def _load_source(excel_path: str, sheet: str,
+                 parquet_path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load the weekly WDCA columns as arrays, memoized per source.
+    
+    Returns (trade_dates, investment, btc_units, btc_price): dates as
+    datetime64[D] and the rest as contiguous float64. The arrays are marked
+    read-only so they can be shared safely between validator instances.
+    """
+    import numpy as np
+
+    columns = None
+    if _parquet_cache_is_fresh(parquet_path, excel_path):
+        columns = _read_parquet_columns(parquet_path)
+
+    if columns is None:
+        df_clean = _read_excel_sheet(excel_path, sheet)
+        _ensure_parquet_cache(df_clean, parquet_path)
+        columns = tuple(df_clean[col].to_numpy() for col in EXCEL_COLUMNS)
+
+    dates, price, inv, btc = columns
+    arrays = [np.asarray(dates, dtype='datetime64[D]')]
+    arrays += [np.ascontiguousarray(arr, dtype=np.float64) for arr in (inv, btc, price)]
+    for arr in arrays:
+        arr.setflags(write=False)
+
+    return tuple(arrays)
+
+@functools.lru_cache(maxsize=None)
+def _optimum_accumulate():
+    """
+    The Optimum accumulation kernel, compiled for the validator's array types.
+    
+    Compiled here on first use rather than when _dca_kernels is imported, so
+    analyzers and tools that never validate don't pay for it.
+    """
+    from src import load_dca_kernels
+    kernels = load_dca_kernels()
+    for signature in kernels.optimum_accumulate_signatures():
+        kernels.optimum_accumulate.compile(signature)
+    return kernels.optimum_accumulate
 
 class PerfectExcelMatchingDCA:
     """Perfect Excel-matching DCA implementation."""
+
+    EXCEL_PATH = "reference/Optimum DCA.xlsx"
+    EXCEL_SHEET = "20222023 WDCA"
+    PARQUET_CACHE_PATH = "reference/Optimum DCA.parquet"
     
     def __init__(self, weekly_budget: float = 250.0):
         self.weekly_budget = weekly_budget
@@ -22,43 +156,58 @@ class PerfectExcelMatchingDCA:
         
         # Excel's exact BTC price for final calculation (from Q2)
         self.excel_final_btc_price = 116157.11
+
+        # DataFrame view of the sheet, built on demand by load_excel_data
+        self._excel_cache = None
+
+        # Contiguous column arrays (SoA) shared by both simulations, populated by _load_arrays
+        self._dates_arr = None
+        self._inv_arr = None
+        self._btc_arr = None
+        self._price_arr = None
+
+    def _load_arrays(self) -> int:
+        """Populate the column arrays (memoized per source) and return the number of weeks."""
+        if self._inv_arr is None:
+            (self._dates_arr, self._inv_arr,
+             self._btc_arr, self._price_arr) = _load_source(
+                os.path.abspath(self.EXCEL_PATH), self.EXCEL_SHEET,
+                os.path.abspath(self.PARQUET_CACHE_PATH))
+        return self._inv_arr.size
         
     def load_excel_data(self):
-        """Load Excel's exact transaction data."""
-        df_excel = pd.read_excel("reference/Optimum DCA.xlsx", sheet_name="20222023 WDCA", header=1)
-        
-        # Clean data
-        date_mask = df_excel['Trade Date'].astype(str).str.contains(r'\d{4}-\d{2}-\d{2}|\d{1,2}\/\d{1,2}\/\d{4}|\d{1,2}-\d{1,2}-\d{4}', na=False)
-        df_clean = df_excel[date_mask].copy()
-        df_clean['Trade Date'] = pd.to_datetime(df_clean['Trade Date']).dt.date
-        
-        return df_clean
+        """Load Excel's exact transaction data as a DataFrame."""
+        if self._excel_cache is None:
+            import pandas as pd
+
+            self._load_arrays()
+            self._excel_cache = pd.DataFrame({
+                'Trade Date': self._dates_arr.astype(object),
+                'BTC price': self._price_arr,
+                'Investment Amount Optimum scenario': self._inv_arr,
+                'BTC unit Optimum scenario': self._btc_arr,
+            })
+        return self._excel_cache
     
-    def run_perfect_simulation(self):
-        """Run simulation that perfectly matches Excel."""
-        
+    def _print_simulation_header(self, weeks: int) -> None:
+        """Print the banner shown before the Excel-matched simulation."""
         print("="*80)
         print(" FINAL PERFECT EXCEL-MATCHING DCA SIMULATION")
         print("="*80)
         
-        excel_data = self.load_excel_data()
-        
-        print(f"Processing {len(excel_data)} weeks of Excel data...")
+        print(f"Processing {weeks} weeks of Excel data...")
         print(f"Using Excel's exact BTC price for final calculation: ${self.excel_final_btc_price:,.2f}")
-        
-        # Process each week using Excel's exact data
-        for i, row in excel_data.iterrows():
-            investment_amount = row['Investment Amount Optimum scenario']
-            btc_purchased = row['BTC unit Optimum scenario']
-            
-            # Accumulate using Excel's exact values
-            self.total_btc_units += btc_purchased
-            self.net_investment += investment_amount
-            
-            if investment_amount >= 0:
-                self.capital_balance -= investment_amount
-            else:
-                self.capital_balance += abs(investment_amount)
+
+    def _optimum_results(self, inv: np.ndarray, btc: np.ndarray) -> dict:
+        """Accumulate Excel's exact weekly Optimum values and compute final metrics."""
+        optimum_accumulate = _optimum_accumulate()
+
+        # Buys draw down the balance and sells add abs() back, i.e. subtract the signed amount
+        total_btc, net_investment, self.capital_balance, _ = optimum_accumulate(
+            inv, btc, self.excel_final_btc_price, self.capital_balance
+        )
+        self.total_btc_units += total_btc
+        self.net_investment += net_investment
         
         # Calculate final metrics using Excel's exact BTC price
         final_holding_value = self.total_btc_units * self.excel_final_btc_price
@@ -73,23 +222,13 @@ class PerfectExcelMatchingDCA:
             'profit_pct': profit_pct,
             'excel_btc_price': self.excel_final_btc_price
         }
-    
-    def run_simple_dca_for_comparison(self):
-        """Run Simple DCA for comparison."""
-        
-        excel_data = self.load_excel_data()
-        
-        simple_btc = 0.0
-        simple_investment = 0.0
-        
-        for i, row in excel_data.iterrows():
-            btc_price = row['BTC price']
-            investment = self.weekly_budget
-            btc_bought = investment / btc_price
-            
-            simple_btc += btc_bought
-            simple_investment += investment
-        
+
+    def _simple_results(self, prices: np.ndarray) -> dict:
+        """Compute Simple DCA metrics for a fixed weekly budget over the given prices."""
+        # Fixed weekly budget broadcast over every weekly price
+        simple_btc = (self.weekly_budget / prices).sum()
+        simple_investment = self.weekly_budget * prices.size
+
         simple_value = simple_btc * self.excel_final_btc_price
         simple_profit = simple_value - simple_investment
         simple_profit_pct = (simple_profit / simple_investment) * 100
@@ -101,6 +240,25 @@ class PerfectExcelMatchingDCA:
             'profit': simple_profit,
             'profit_pct': simple_profit_pct
         }
+    
+    def run_perfect_simulation(self):
+        """Run simulation that perfectly matches Excel."""
+        
+        self._print_simulation_header(self._load_arrays())
+        return self._optimum_results(self._inv_arr, self._btc_arr)
+    
+    def run_simple_dca_for_comparison(self):
+        """Run Simple DCA for comparison."""
+        
+        self._load_arrays()
+        return self._simple_results(self._price_arr)
+
+    def run_both(self):
+        """Run Optimum and Simple DCA from a single load of the sheet's columns."""
+        
+        self._print_simulation_header(self._load_arrays())
+        return (self._optimum_results(self._inv_arr, self._btc_arr),
+                self._simple_results(self._price_arr))
 
 def main():
     """Run the perfect comparison."""
@@ -110,11 +268,8 @@ def main():
     
     dca = PerfectExcelMatchingDCA()
     
-    # Run Optimum DCA
-    optimum_results = dca.run_perfect_simulation()
-    
-    # Run Simple DCA
-    simple_results = dca.run_simple_dca_for_comparison()
+    # Run Optimum and Simple DCA from one load of the sheet
+    optimum_results, simple_results = dca.run_both()
     
     # Display results
     print("\n FINAL RESULTS COMPARISON")
@@ -152,10 +307,14 @@ def main():
     print(f"   Expected Investment: ${excel_expected['net_investment']:,.2f}")
     
     print(f"\n MATCH VERIFICATION:")
-    value_match = abs(optimum_results['holding_value'] - excel_expected['holding_value']) < 0.01
-    return_match = abs(optimum_results['profit_pct'] - excel_expected['profit_pct']) < 0.1
-    btc_match = abs(optimum_results['total_btc'] - excel_expected['total_btc']) < 0.00000001
-    investment_match = abs(optimum_results['net_investment'] - excel_expected['net_investment']) < 0.01
+    value_match = math.isclose(optimum_results['holding_value'], excel_expected['holding_value'],
+                               rel_tol=0, abs_tol=0.01)
+    return_match = math.isclose(optimum_results['profit_pct'], excel_expected['profit_pct'],
+                                rel_tol=0, abs_tol=0.1)
+    btc_match = math.isclose(optimum_results['total_btc'], excel_expected['total_btc'],
+                             rel_tol=0, abs_tol=0.00000001)
+    investment_match = math.isclose(optimum_results['net_investment'], excel_expected['net_investment'],
+                                    rel_tol=0, abs_tol=0.01)
     
     print(f"   Holding Value: {' PERFECT' if value_match else ' MISMATCH'}")
     print(f"   Return %: {' PERFECT' if return_match else ' MISMATCH'}")